@@ -330,3 +330,37 @@ def insert_fillet(edges, pos, radius, reversed=False):
         else:
             output_edges.append(edge)
     return output_edges
+
+
+def insert_fillets(edges, fillets, reversed=False):
+    """insert several fillets with a single pass over the edges
+
+    Args:
+        edges (list): the edges of a wire
+        fillets (list): (pos, radius) pairs, a fillet is inserted between
+            edges[pos] and edges[pos + 1] (pos refers to the input edges)
+        reversed (bool): passed to fillet_between_edges
+
+    Returns:
+        list: the edges with the fillets, fillets with a radius of zero are
+            skipped
+    """
+    assert all(pos < (len(edges) - 1) for pos, _ in fillets)
+    radii = {pos: radius for pos, radius in fillets if radius > 0}
+    if not radii:
+        return list(edges)
+    output_edges = []
+    e1 = edges[0]
+    for pos, e2 in enumerate(edges[1:]):
+        if pos not in radii:
+            output_edges.append(e1)
+            e1 = e2
+            continue
+        fillet_edges = fillet_between_edges(e1, e2, radii[pos], reversed)
+        if not fillet_edges:
+            raise RuntimeError("fillet not possible")
+        output_edges += fillet_edges[:2]
+        # the second edge may be trimmed by the next fillet
+        e1 = fillet_edges[2]
+    output_edges.append(e1)
+    return output_edges
@@ -25,7 +25,7 @@ from freecad import part
 import numpy as np
 
 from pygears._functions import reflection
-from .basegear import BaseGear, fcvec, points_to_wire, insert_fillet
+from .basegear import BaseGear, fcvec, points_to_wire, insert_fillets
 
 QT_TRANSLATE_NOOP = app.Qt.QT_TRANSLATE_NOOP
 
@@ -228,13 +228,11 @@ class CycloidGearRack(BaseGear):
         line_0 = [np.array([-(1 + c) * m, -m * np.pi / 2]), points[0]]
         tooth = points_to_wire([line_0, points, line_1, points_1, line_2])
 
-        edges = tooth.Edges
-        edges = insert_fillet(edges, 0, m * root_fillet)
-        edges = insert_fillet(edges, 2, m * head_fillet)
-        edges = insert_fillet(edges, 4, m * head_fillet)
-        edges = insert_fillet(edges, 6, m * root_fillet)
-
-        tooth_edges = [e for e in edges if e is not None]
+        r_head = m * head_fillet
+        r_root = m * root_fillet
+        tooth_edges = insert_fillets(
+            tooth.Edges, [(0, r_root), (1, r_head), (2, r_head), (3, r_root)]
+        )
         p_end = np.array(tooth_edges[-2].lastVertex().Point[:-1])
         p_start = np.array(tooth_edges[1].firstVertex().Point[:-1])
         p_start += np.array([0, np.pi * m])
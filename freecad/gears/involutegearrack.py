@@ -22,10 +22,13 @@ from freecad import app
 from freecad import part
 
 from pygears.involute_tooth import InvoluteRack
-from .basegear import BaseGear, fcvec, points_to_wire, insert_fillet
+from .basegear import BaseGear, fcvec, points_to_wire, insert_fillets
 
 QT_TRANSLATE_NOOP = app.Qt.QT_TRANSLATE_NOOP
 
+# number of teeth drawn at each end of a simplified rack
+SIMPLIFIED_TEETH = 3
+
 
 class InvoluteGearRack(BaseGear):
     """FreeCAD gear rack"""
@@ -215,93 +218,152 @@ class InvoluteGearRack(BaseGear):
         obj.rack._update()
         m, m_n, pitch, pressure_angle_t = obj.rack.compute_properties()
         obj.transverse_pitch = "{} mm".format(pitch)
+        num_teeth = obj.num_teeth
+        height = obj.height.Value
         t = obj.thickness.Value
         c = obj.clearance
         h = obj.head
         alpha = obj.pressure_angle.Value * np.pi / 180.0
+        beta = obj.rack.beta
+        tan_a = np.tan(alpha)
+        tan_b = np.tan(beta)
         head_fillet = obj.head_fillet
         root_fillet = obj.root_fillet
-        x1 = -m * np.pi / 2
-        y1 = -m * (1 + c)
-        y2 = y1
-        x2 = -m * np.pi / 4 + y2 * np.tan(alpha)
-        y3 = m * (1 + h)
-        x3 = -m * np.pi / 4 + y3 * np.tan(alpha)
-        x4 = -x3
-        x5 = -x2
-        x6 = -x1
-        y4 = y3
-        y5 = y2
-        y6 = y1
-        p1 = np.array([y1, x1])
-        p2 = np.array([y2, x2])
-        p3 = np.array([y3, x3])
-        p4 = np.array([y4, x4])
-        p5 = np.array([y5, x5])
-        p6 = np.array([y6, x6])
-        line1 = [p1, p2]
-        line2 = [p2, p3]
-        line3 = [p3, p4]
-        line4 = [p4, p5]
-        line5 = [p5, p6]
-        tooth = part.Wire(points_to_wire([line1, line2, line3, line4, line5]))
-
-        edges = tooth.Edges
-        edges = insert_fillet(edges, 0, m * root_fillet)
-        edges = insert_fillet(edges, 2, m * head_fillet)
-        edges = insert_fillet(edges, 4, m * head_fillet)
-        edges = insert_fillet(edges, 6, m * root_fillet)
-
-        tooth_edges = [e for e in edges if e is not None]
-        p_end = np.array(tooth_edges[-2].lastVertex().Point[:-1])
-        p_start = np.array(tooth_edges[1].firstVertex().Point[:-1])
-        p_start += np.array([0, np.pi * m])
-        edge = points_to_wire([[p_end, p_start]]).Edges
-        tooth = part.Wire(tooth_edges[1:-1] + edge)
-        teeth = [tooth]
-
-        for i in range(obj.num_teeth - 1):
-            tooth = tooth.copy()
-            tooth.translate(app.Vector(0, np.pi * m, 0))
-            teeth.append(tooth)
-
-        teeth[-1] = part.Wire(teeth[-1].Edges[:-1])
-
-        if obj.add_endings:
-            teeth = [part.Wire(tooth_edges[0])] + teeth
-            last_edge = tooth_edges[-1]
-            last_edge.translate(app.Vector(0, np.pi * m * (obj.num_teeth - 1), 0))
-            teeth = teeth + [part.Wire(last_edge)]
-
-        p_start = np.array(teeth[0].Edges[0].firstVertex().Point[:-1])
-        p_end = np.array(teeth[-1].Edges[-1].lastVertex().Point[:-1])
-        p_start_1 = p_start - np.array([obj.thickness.Value, 0.0])
-        p_end_1 = p_end - np.array([obj.thickness.Value, 0.0])
-
-        line6 = [p_start, p_start_1]
-        line7 = [p_start_1, p_end_1]
-        line8 = [p_end_1, p_end]
-
-        bottom = points_to_wire([line6, line7, line8])
-
-        pol = part.Wire([bottom] + teeth)
-
-        if obj.height.Value == 0:
-            return pol
-        elif obj.rack.beta == 0:
-            face = part.Face(part.Wire(pol))
-            return face.extrude(fcvec([0.0, 0.0, obj.height.Value]))
-        elif obj.double_helix:
-            pol2 = part.Wire(pol)
-            pol2.translate(
-                fcvec([0.0, np.tan(obj.rack.beta) * obj.height.Value / 2, obj.height.Value / 2])
+        pi_m = np.pi * m
+        pts = _rack_profile(m, c, h, tan_a)
+        simplified = obj.rack.simplified and num_teeth > 2 * SIMPLIFIED_TEETH
+        if simplified:
+            # only the first and last teeth are drawn and connected along
+            # the pitch line, so the number of drawn teeth (and the
+            # topology) doesn't depend on num_teeth.
+            k = SIMPLIFIED_TEETH
+            tooth_ids = np.r_[0:k, num_teeth - k : num_teeth]
+            # the flanks cross the pitch line (y = 0) at -+pi_m / 4
+            pitch_start = (0.0, pi_m / 4 + (k - 1) * pi_m)
+            pitch_end = (0.0, -pi_m / 4 + (num_teeth - k) * pi_m)
+        else:
+            tooth_ids = np.arange(num_teeth)
+
+        if head_fillet > 0 or root_fillet > 0:
+            lines = [pts[i : i + 2] for i in range(5)]
+            tooth = part.Wire(points_to_wire(lines))
+            r_head = m * head_fillet
+            r_root = m * root_fillet
+            tooth_edges = insert_fillets(
+                tooth.Edges, [(0, r_root), (1, r_head), (2, r_head), (3, r_root)]
             )
-            pol3 = part.Wire(pol)
-            pol3.translate(fcvec([0.0, 0.0, obj.height.Value]))
+            # the fillets are arcs, so the teeth are copied as wires
+            first_pt = _pt(tooth_edges[1].firstVertex())
+            last_pt = _pt(tooth_edges[-2].lastVertex())
+            edge = points_to_wire(
+                [[last_pt, (first_pt[0], first_pt[1] + pi_m)]]
+            ).Edges
+            tooth = part.Wire(tooth_edges[1:-1] + edge)
+            pol_edges = []
+
+            for i in tooth_ids:
+                tooth_i = tooth.copy()
+                tooth_i.translate(app.Vector(0, pi_m * i, 0))
+                pol_edges += tooth_i.Edges
+
+            # the last tooth has no connecting edge
+            pol_edges.pop()
+
+            if simplified:
+                # replace everything from the right flank of tooth k - 1 to
+                # the left flank of tooth num_teeth - k (root fillets and
+                # connecting edge included) by the pitch line. The tooth wire
+                # is [root fillet], left flank, ..., right flank, [root fillet],
+                # connecting edge.
+                n_edges = len(tooth.Edges)
+                n_root = 1 if r_root > 0 else 0
+                right_flank = (k - 1) * n_edges + n_edges - 2 - n_root
+                left_flank = k * n_edges + n_root
+                flank_end = _pt(pol_edges[right_flank].firstVertex())
+                flank_start = _pt(pol_edges[left_flank].lastVertex())
+                pol_edges[right_flank : left_flank + 1] = points_to_wire(
+                    [
+                        [flank_end, pitch_start],
+                        [pitch_start, pitch_end],
+                        [pitch_end, flank_start],
+                    ]
+                ).Edges
+
+            if obj.add_endings:
+                last_edge = tooth_edges[-1]
+                last_edge.translate(app.Vector(0, pi_m * (num_teeth - 1), 0))
+                pol_edges = [tooth_edges[0]] + pol_edges + [last_edge]
+
+            # the outer points are known from the tooth profile, no need to
+            # query the translated wires
+            if obj.add_endings:
+                p_start = tuple(pts[0])
+                p_end = tuple(pts[5])
+            else:
+                p_start = first_pt
+                p_end = last_pt
+            p_end = (p_end[0], p_end[1] + pi_m * (num_teeth - 1))
+            p_start_1 = (p_start[0] - t, p_start[1])
+            p_end_1 = (p_end[0] - t, p_end[1])
+
+            line6 = [p_end, p_end_1]
+            line7 = [p_end_1, p_start_1]
+            line8 = [p_start_1, p_start]
+
+            bottom = points_to_wire([line6, line7, line8])
+
+            # one wire from all edges instead of wrapping the tooth wires
+            pol = part.Wire(pol_edges + bottom.Edges)
+        else:
+            # without fillets the whole outline is one closed polyline: p2..p5
+            # of every tooth translated by the pitch, the endings and the bottom
+            offsets = tooth_ids[:, None, None] * np.array([0, pi_m])
+            outline = (pts[None, 1:5] + offsets).reshape(-1, 2)
+            if simplified:
+                outline[4 * k - 1] = pitch_start
+                outline[4 * k] = pitch_end
+            if obj.add_endings:
+                outline = np.concatenate([pts[:1], outline, pts[5:] + offsets[-1]])
+            bottom = outline[[-1, 0]] - np.array([t, 0.0])
+            outline = np.concatenate([outline, bottom, outline[:1]])
+            pol = points_to_wire(np.stack([outline[:-1], outline[1:]], axis=1))
+
+        if height == 0:
+            return pol
+
+        v_height = fcvec([0.0, 0.0, height])
+        if beta == 0:
+            face = part.Face(pol)
+            return face.extrude(v_height)
+
+        v_helix = fcvec([0.0, tan_b * height, height])
+        if obj.double_helix:
+            pol2 = pol.copy()
+            pol2.translate(v_helix * 0.5)
+            pol3 = pol.copy()
+            pol3.translate(v_height)
             return part.makeLoft([pol, pol2, pol3], True, True)
         else:
-            pol2 = part.Wire(pol)
-            pol2.translate(
-                fcvec([0.0, np.tan(obj.rack.beta) * obj.height.Value, obj.height.Value])
-            )
+            pol2 = pol.copy()
+            pol2.translate(v_helix)
             return part.makeLoft([pol, pol2], True)
+
+
+def _rack_profile(m, c, h, tan_a):
+    """points p1..p6 of a single trapezoidal rack tooth as (radial, axial)
+    pairs, symmetric to the x-axis"""
+    y1 = -m * (1 + c)
+    y3 = m * (1 + h)
+    x1 = -m * np.pi / 2
+    x2 = -m * np.pi / 4 + y1 * tan_a
+    x3 = -m * np.pi / 4 + y3 * tan_a
+    pts = np.empty((6, 2))
+    pts[:, 0] = y1, y1, y3, y3, y1, y1
+    pts[:, 1] = x1, x2, x3, -x3, -x2, -x1
+    return pts
+
+
+def _pt(vertex):
+    """2d coordinates of a vertex as a tuple"""
+    point = vertex.Point
+    return (point.x, point.y)
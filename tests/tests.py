@@ -1,8 +1,16 @@
 import unittest
 
+import numpy as np
+
 from freecad import app
 from freecad import part
-from freecad.gears.basegear import helical_extrusion
+from freecad.gears.basegear import (
+    helical_extrusion,
+    insert_fillet,
+    insert_fillets,
+    points_to_wire,
+)
+from freecad.gears.involutegearrack import InvoluteGearRack
 
 
 
@@ -27,5 +35,128 @@ class GearTests(unittest.TestCase):
         self.assertAlmostEqual(solid.Faces[1].valueAt(0,0)[2], height)
         self.assertAlmostEqual(solid.Faces[2].valueAt(0,0)[2], 0.)
 
+    def test_insert_fillets(self):
+        """insert_fillets gives the same edges as sequential insert_fillet
+        calls, where positions are shifted by the previously inserted fillets"""
+        pts = [[0, 0], [0, 1], [1, 2], [1, 3], [0, 4], [0, 5]]
+        lines = [pts[i : i + 2] for i in range(5)]
+        for radii in ([0.2, 0.2, 0.2, 0.2], [0.2, 0.0, 0.2, 0.2]):
+            with self.subTest(radii=radii):
+                edges = points_to_wire(lines).Edges
+                expected = edges
+                for pos, radius in enumerate(radii):
+                    expected = insert_fillet(expected, 2 * pos, radius)
+                expected = [e for e in expected if e is not None]
+                edges = insert_fillets(edges, list(enumerate(radii)))
+                self.assertEqual(len(edges), len(expected))
+                for e1, e2 in zip(edges, expected):
+                    for v1, v2 in zip(e1.Vertexes, e2.Vertexes):
+                        self.assertAlmostEqual((v1.Point - v2.Point).Length, 0.0)
+
+    def make_rack(self, **properties):
+        doc = app.newDocument()
+        self.addCleanup(app.closeDocument, doc.Name)
+        obj = doc.addObject("Part::FeaturePython", "rack")
+        InvoluteGearRack(obj)
+        obj.height = 0  # only the wire of the rack
+        for name, value in properties.items():
+            setattr(obj, name, value)
+        doc.recompute()
+        return obj
+
+    def test_simplified_rack(self):
+        """a simplified rack has a constant number of edges, the same length
+        as the full rack and a valid shape"""
+        fillets = ((0.0, 0.0), (0.1, 0.0), (0.0, 0.1), (0.1, 0.1))
+        for head_fillet, root_fillet in fillets:
+            with self.subTest(head_fillet=head_fillet, root_fillet=root_fillet):
+                props = dict(head_fillet=head_fillet, root_fillet=root_fillet)
+                racks = {}
+                for num_teeth in (15, 16, 50, 100):
+                    for simplified in (False, True):
+                        racks[num_teeth, simplified] = self.make_rack(
+                            num_teeth=num_teeth, simplified=simplified, **props
+                        )
+                faces = {key: part.Face(rack.Shape) for key, rack in racks.items()}
+                for face in faces.values():
+                    self.assertTrue(face.isValid())
+
+                rack_15 = racks[15, True].Shape
+                rack_100 = racks[100, True].Shape
+                full_100 = racks[100, False].Shape
+                self.assertEqual(len(rack_15.Edges), len(rack_100.Edges))
+                self.assertLess(len(rack_100.Edges), len(full_100.Edges))
+                self.assertAlmostEqual(
+                    rack_100.BoundBox.YLength, full_100.BoundBox.YLength
+                )
+
+                # every removed tooth replaces one pitch of the full rack by
+                # a rectangle reaching from the bottom to the pitch line
+                obj = racks[15, False]
+                m = obj.module.Value
+                pitch = np.pi * m
+                rect = pitch * (obj.thickness.Value + m * (1 + obj.clearance))
+                cell = faces[16, False].Area - faces[15, False].Area
+                removed = [
+                    faces[n, False].Area - faces[n, True].Area for n in (50, 100)
+                ]
+                self.assertAlmostEqual(
+                    removed[1] - removed[0],
+                    50 * (cell - rect),
+                    delta=1e-6 * faces[100, False].Area,
+                )
+
+                solid = self.make_rack(num_teeth=100, simplified=True, height=5, **props)
+                self.assertTrue(solid.Shape.isValid())
+                volume = faces[100, True].Area * 5
+                self.assertAlmostEqual(solid.Shape.Volume, volume, delta=1e-6 * volume)
+
+                # too few teeth to simplify
+                rack_5 = self.make_rack(num_teeth=5, simplified=True, **props)
+                full_5 = self.make_rack(num_teeth=5, **props)
+                self.assertEqual(len(rack_5.Shape.Edges), len(full_5.Shape.Edges))
+
+    def test_default_rack(self):
+        """the default rack (15 teeth, no fillets) matches the values of the
+        tooth by tooth implementation it replaced"""
+        # add_endings: (number of edges, area, y_min, y_max)
+        expected = {
+            True: (64, 291.704824, -1.570796, 45.553093),
+            False: (62, 288.400470, -1.240361, 45.222658),
+        }
+        height = 5.0
+        shift = np.tan(np.radians(10)) * height
+        for add_endings, (num_edges, area, y_min, y_max) in expected.items():
+            with self.subTest(add_endings=add_endings):
+                wire = self.make_rack(add_endings=add_endings).Shape
+                self.assertEqual(len(wire.Edges), num_edges)
+                self.assertAlmostEqual(part.Face(wire).Area, area, places=5)
+
+            for helix_angle, double_helix, y_shift in (
+                (0.0, False, 0.0),
+                (10.0, False, shift),
+                (10.0, True, shift / 2),
+            ):
+                with self.subTest(
+                    add_endings=add_endings,
+                    helix_angle=helix_angle,
+                    double_helix=double_helix,
+                ):
+                    solid = self.make_rack(
+                        add_endings=add_endings,
+                        height=height,
+                        helix_angle=helix_angle,
+                        double_helix=double_helix,
+                    ).Shape
+                    self.assertTrue(solid.isValid())
+                    self.assertAlmostEqual(solid.Volume, area * height, places=3)
+                    bound_box = solid.BoundBox
+                    self.assertAlmostEqual(bound_box.XMin, -6.25, places=5)
+                    self.assertAlmostEqual(bound_box.XMax, 1.0, places=5)
+                    self.assertAlmostEqual(bound_box.YMin, y_min, places=5)
+                    self.assertAlmostEqual(bound_box.YMax, y_max + y_shift, places=5)
+                    self.assertAlmostEqual(bound_box.ZMin, 0.0, places=5)
+                    self.assertAlmostEqual(bound_box.ZMax, height, places=5)
+
 if __name__ == "__main__":
     unittest.main(verbosity=4)
\ No newline at end of file